@@ -62,8 +62,18 @@ from .sonarqube_generator import print_sonarqube_report
 from .coveralls_generator import print_coveralls_report
 
 
+# Runs of two or more path separators
+_DOUBLE_SEP_RE = re.compile(re.escape(os.sep) + '{2,}')
+
+
+# Exit codes of fail_under(), the combined one is the bitwise or
+EXIT_LINE_NOK = 2
+EXIT_BRANCH_NOK = 4
+EXIT_LINE_AND_BRANCH_NOK = EXIT_LINE_NOK | EXIT_BRANCH_NOK
+
+
 #
-# Exits with status 2 if below threshold
+# Exits with one of the EXIT_*_NOK statuses if below threshold
 #
 def fail_under(covdata, threshold_line, threshold_branch):
     (lines_total, lines_covered, percent,
@@ -74,11 +84,11 @@ def fail_under(covdata, threshold_line, threshold_branch):
         percent_branches = 100.0
 
     if percent < threshold_line and percent_branches < threshold_branch:
-        sys.exit(6)
+        sys.exit(EXIT_LINE_AND_BRANCH_NOK)
     if percent < threshold_line:
-        sys.exit(2)
+        sys.exit(EXIT_LINE_NOK)
     if percent_branches < threshold_branch:
-        sys.exit(4)
+        sys.exit(EXIT_BRANCH_NOK)
 
 
 def create_argument_parser():
@@ -110,6 +120,11 @@ def create_argument_parser():
     return parser
 
 
+# The parser only depends on the static option definitions,
+# so it is built once and reused by every main() call.
+_ARGUMENT_PARSER = create_argument_parser()
+
+
 COPYRIGHT = (
     "Copyright 2013-2018 the gcovr authors\n"
     "Copyright 2013 Sandia Corporation\n"
@@ -141,8 +156,7 @@ class Options(object):
 
 
 def main(args=None):
-    parser = create_argument_parser()
-    cli_options = parser.parse_args(args=args)
+    cli_options = _ARGUMENT_PARSER.parse_args(args=args)
 
     # load the config
     cfg_name = find_config_name(cli_options)
@@ -188,6 +202,11 @@ def main(args=None):
             "value of --html-tab-size= should be greater 0.")
         sys.exit(1)
 
+    if options.gcov_parallel < 1:
+        logger.error(
+            "value of --jobs= should be greater 0.")
+        sys.exit(1)
+
     potential_html_output = (
         (options.html and options.html.value)
         or (options.html_details and options.html_details.value)
@@ -211,19 +230,24 @@ def main(args=None):
                 "directory of your project.\n"
                 "\tThis option cannot be an empty string.")
             sys.exit(1)
-        tmp = options.objdir.replace('/', os.sep).replace('\\', os.sep)
-        while os.sep + os.sep in tmp:
-            tmp = tmp.replace(os.sep + os.sep, os.sep)
-        if normpath(options.objdir) != tmp:
+        # replace via function, a "\\" separator would be read as an escape
+        tmp = _DOUBLE_SEP_RE.sub(
+            lambda _: os.sep,
+            options.objdir.replace('/', os.sep).replace('\\', os.sep))
+        norm_objdir = normpath(options.objdir)
+        if norm_objdir != tmp:
             logger.warn(
                 "relative referencing in --object-directory.\n"
                 "\tthis could cause strange errors when gcovr attempts to\n"
                 "\tidentify the original gcc working directory.")
-        if not os.path.exists(normpath(options.objdir)):
+        if not os.path.exists(norm_objdir):
             logger.error(
                 "Bad --object-directory option.\n"
                 "\tThe specified directory does not exist.")
             sys.exit(1)
+        options.abs_objdir = os.path.abspath(options.objdir)
+    else:
+        options.abs_objdir = None
 
     options.starting_dir = os.path.abspath(os.getcwd())
     if not options.root:
@@ -243,20 +267,23 @@ def main(args=None):
     # but is used to turn absolute paths into relative paths
     options.root_filter = re.compile('^' + re.escape(options.root_dir + os.sep))
 
+    # The filters are built once and then only read by the worker threads,
+    # so they are stored as tuples.
     if options.exclude_dirs is not None:
-        options.exclude_dirs = [
-            f.build_filter(logger) for f in options.exclude_dirs]
+        options.exclude_dirs = tuple(
+            f.build_filter(logger) for f in options.exclude_dirs)
 
-    options.exclude = [f.build_filter(logger) for f in options.exclude]
-    options.filter = [f.build_filter(logger) for f in options.filter]
+    options.exclude = tuple(f.build_filter(logger) for f in options.exclude)
+    options.filter = tuple(f.build_filter(logger) for f in options.filter)
     if not options.filter:
-        options.filter = [DirectoryPrefixFilter(options.root_dir)]
+        options.filter = (DirectoryPrefixFilter(options.root_dir),)
 
-    options.gcov_exclude = [
-        f.build_filter(logger) for f in options.gcov_exclude]
-    options.gcov_filter = [f.build_filter(logger) for f in options.gcov_filter]
+    options.gcov_exclude = tuple(
+        f.build_filter(logger) for f in options.gcov_exclude)
+    options.gcov_filter = tuple(
+        f.build_filter(logger) for f in options.gcov_filter)
     if not options.gcov_filter:
-        options.gcov_filter = [AlwaysMatchFilter()]
+        options.gcov_filter = (AlwaysMatchFilter(),)
 
     # Output the filters for debugging
     for name, filters in [
@@ -315,7 +342,6 @@ def collect_coverage_from_tracefiles(covdata, options, logger):
             for trace_file in trace_files:
                 datafiles.add(normpath(trace_file))
 
-    options.root_dir = os.path.abspath(options.root)
     gcovr_json_files_to_coverage(datafiles, covdata, options)
 
 
@@ -329,25 +355,37 @@ def collect_coverage_from_gcov(covdata, options, logger):
         process_file = process_existing_gcov_file
 
     # Get data files
-    if not options.search_paths:
-        options.search_paths = [options.root]
+    search_paths = options.search_paths
+    if not search_paths:
+        search_paths = [options.root]
 
         if options.objdir is not None:
-            options.search_paths.append(options.objdir)
-
-    for search_path in options.search_paths:
-        datafiles.update(find_files(search_path, logger, options.exclude_dirs))
+            search_paths.append(options.objdir)
 
     # Get coverage data
-    with Workers(options.gcov_parallel, lambda: {
-                 'covdata': dict(),
-                 'workdir': mkdtemp(),
-                 'toerase': set(),
-                 'options': options}) as pool:
-        logger.verbose_msg("Pool started with {} threads", pool.size())
-        for file_ in datafiles:
-            pool.add(process_file, file_)
-        contexts = pool.wait()
+    contexts = []
+    try:
+        with Workers(options.gcov_parallel, lambda: {
+                     'covdata': dict(),
+                     'workdir': mkdtemp(),
+                     'toerase': set(),
+                     'options': options}) as pool:
+            contexts = pool.contexts
+            logger.verbose_msg("Pool started with {} threads", pool.size())
+            # The data files are processed while the search paths
+            # are still being scanned.
+            for search_path in search_paths:
+                for file_ in find_files(
+                        search_path, logger, options.exclude_dirs):
+                    if file_ not in datafiles:
+                        datafiles.add(file_)
+                        pool.add(process_file, file_)
+            pool.wait()
+    finally:
+        # The pool is already running while scanning,
+        # so also clean up if a search path is bad.
+        for context in contexts:
+            rmtree(context['workdir'])
 
     toerase = set()
     for context in contexts:
@@ -357,7 +395,6 @@ def collect_coverage_from_gcov(covdata, options, logger):
             else:
                 covdata[fname].update(cov)
         toerase.update(context['toerase'])
-        rmtree(context['workdir'])
     for filepath in toerase:
         if os.path.exists(filepath):
             os.remove(filepath)
@@ -11,7 +11,6 @@
 # This software is distributed under the BSD license.
 from argparse import ArgumentTypeError, SUPPRESS
 from locale import getpreferredencoding
-from multiprocessing import cpu_count
 from typing import Iterable, Any
 import os
 import re
@@ -20,6 +19,17 @@ from .utils import FilterOption
 from .html_generator import CssRenderer
 
 
+def _default_jobs():
+    r"""
+    Number of CPUs this process may run on, respecting CPU affinity masks
+    (e.g. cgroup/cpuset limits of CI containers) where the OS supports it.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
 def check_percentage(value):
     r"""
     Check that the percentage is within a reasonable range and if so return it.
@@ -967,11 +977,14 @@ GCOVR_CONFIG_OPTIONS = [
         action="store_true",
     ),
     GcovrConfigOption(
-        "gcov_parallel", ["-j"], config='gcov-parallel',
+        "gcov_parallel", ["-j", "--jobs"], config='gcov-parallel',
         group="gcov_options",
-        help="Set the number of threads to use in parallel.",
+        help="Set the number of threads to use in parallel. "
+             "Each thread runs its own gcov processes, "
+             "so this speeds up projects with many object files. "
+             "Without a value, one thread per available CPU is used.",
         nargs="?",
-        const=cpu_count(),
+        const=_default_jobs(),
         type=int,
         default=1,
     )
@@ -190,10 +190,13 @@ class FileCoverage(object):
         # type: () -> Tuple[int, int, Optional[float]]
         total = 0
         cover = 0
+        # count the branches directly,
+        # LineCoverage.branch_coverage() would also compute a percentage
         for line in self.lines.values():
-            b_total, b_cover, _ = line.branch_coverage()
-            total += b_total
-            cover += b_cover
+            total += len(line.branches)
+            for branch in line.branches.values():
+                if branch.is_covered:
+                    cover += 1
 
         percent = calculate_coverage(cover, total, nan_value=None)
         return total, cover, percent
@@ -29,16 +29,19 @@ cpp_style_comment_pattern = re.compile(r'//.*?$')
 
 def find_existing_gcov_files(search_path, logger, exclude_dirs):
     """Find .gcov files under the given search path.
+
+    The files are yielded while the directory tree is still being walked.
     """
     logger.verbose_msg(
         "Scanning directory {} for gcov files...", search_path)
-    gcov_files = list(search_file(
-        re.compile(r".*\.gcov$").match, search_path,
-        exclude_dirs=exclude_dirs))
+    count = 0
+    for filename in search_file(
+            re.compile(r".*\.gcov$").match, search_path,
+            exclude_dirs=exclude_dirs):
+        count += 1
+        yield filename
     logger.verbose_msg(
-        "Found {} files (and will process all of them)",
-        len(gcov_files))
-    return gcov_files
+        "Found {} files (and will process all of them)", count)
 
 
 def find_datafiles(search_path, logger, exclude_dirs):
@@ -48,23 +51,26 @@ def find_datafiles(search_path, logger, exclude_dirs):
     However, that is useful information when a compilation unit
     is never actually exercised by the test code.
     So we ONLY return them if there's no corresponding .gcda file.
+
+    The .gcda files are yielded while the directory tree is still being
+    walked, the .gcno files only after the walk is complete.
     """
     logger.verbose_msg(
         "Scanning directory {} for gcda/gcno files...", search_path)
-    files = list(search_file(
-        re.compile(r".*\.gc(da|no)$").match, search_path,
-        exclude_dirs=exclude_dirs))
-    gcda_files = []
+    count = 0
     gcno_files = []
     known_file_stems = set()
-    for filename in files:
+    for filename in search_file(
+            re.compile(r".*\.gc(da|no)$").match, search_path,
+            exclude_dirs=exclude_dirs):
+        count += 1
         stem, ext = os.path.splitext(filename)
         if ext == '.gcda':
-            gcda_files.append(filename)
             known_file_stems.add(stem)
+            yield filename
         elif ext == '.gcno':
             gcno_files.append(filename)
-    # remove gcno files that match a gcno stem
+    # remove gcno files that match a gcda stem
     gcno_files = [
         filename
         for filename in gcno_files
@@ -72,8 +78,9 @@ def find_datafiles(search_path, logger, exclude_dirs):
     ]
     logger.verbose_msg(
         "Found {} files (and will process {})",
-        len(files), len(gcda_files) + len(gcno_files))
-    return gcda_files + gcno_files
+        count, len(known_file_stems) + len(gcno_files))
+    for filename in gcno_files:
+        yield filename
 
 
 noncode_mapper = dict.fromkeys(ord(i) for i in '}{')
@@ -97,7 +104,7 @@ def process_gcov_data(data_fname, covdata, source_fname, options, currdir=None):
         fname = guess_source_file_name(
             firstline, data_fname, source_fname,
             root_dir=options.root_dir, starting_dir=options.starting_dir,
-            obj_dir=None if options.objdir is None else os.path.abspath(options.objdir),
+            obj_dir=options.abs_objdir,
             logger=logger, currdir=currdir)
 
         logger.verbose_msg("Parsing coverage data for file {}", fname)
@@ -115,7 +122,9 @@ def process_gcov_data(data_fname, covdata, source_fname, options, currdir=None):
             logger.verbose_msg("  Excluding coverage data for file {}", fname)
             return
 
-        key = os.path.normpath(fname)
+        # Interned, as the same file name is looked up for every
+        # translation unit which includes the file.
+        key = sys.intern(os.path.normpath(fname))
 
         parser = GcovParser(key, logger=logger)
         parser.parse_all_lines(
@@ -125,7 +134,12 @@ def process_gcov_data(data_fname, covdata, source_fname, options, currdir=None):
             ignore_parse_errors=options.gcov_ignore_parse_errors,
             exclude_lines_by_pattern=options.exclude_lines_by_pattern)
 
-        covdata.setdefault(key, FileCoverage(key)).update(parser.coverage)
+        # The parsed coverage is not used elsewhere, so the first one
+        # for a file is stored directly instead of being merged into a copy.
+        if key in covdata:
+            covdata[key].update(parser.coverage)
+        else:
+            covdata[key] = parser.coverage
 
 
 def guess_source_file_name(
@@ -126,7 +126,7 @@ def gcovr_json_files_to_coverage(filenames, covdata, options):
         coverage = {}
         for gcovr_file in gcovr_json_data['files']:
             file_path = os.path.join(
-                os.path.abspath(options.root),
+                options.root_dir,
                 os.path.normpath(gcovr_file['file']))
 
             filtered, excluded = apply_filter_include_exclude(
@@ -151,10 +151,10 @@ def gcovr_json_files_to_coverage(filenames, covdata, options):
 
 def _split_coverage_results(covdata, coverages):
     for coverage in coverages.values():
-        if coverage.filename not in covdata:
-            covdata[coverage.filename] = FileCoverage(coverage.filename)
-
-        covdata[coverage.filename].update(coverage)
+        if coverage.filename in covdata:
+            covdata[coverage.filename].update(coverage)
+        else:
+            covdata[coverage.filename] = coverage
 
 
 def _json_from_lines(lines):
@@ -254,6 +254,13 @@ def test_html_tab_size_zero(capsys):
     assert c.exception.code != 0
 
 
+def test_jobs_zero(capsys):
+    c = capture(capsys, ['--jobs', '0'])
+    assert c.out == ''
+    assert 'value of --jobs= should be greater 0.' in c.err
+    assert c.exception.code != 0
+
+
 def test_multiple_output_formats_to_stdout(capsys):
     c = capture(capsys, ['--xml', '--html', '--sonarqube', '--coveralls'])
     assert 'HTML output skipped' in c.err
@@ -114,14 +114,12 @@ def get_global_stats(covdata):
     branches_total = 0
     branches_covered = 0
 
-    keys = list(covdata.keys())
-
-    for key in keys:
-        (total, covered, _) = covdata[key].line_coverage()
+    for coverage in covdata.values():
+        (total, covered, _) = coverage.line_coverage()
         lines_total += total
         lines_covered += covered
 
-        (total, covered, _) = covdata[key].branch_coverage()
+        (total, covered, _) = coverage.branch_coverage()
         branches_total += total
         branches_covered += covered
 
@@ -184,10 +182,12 @@ class Filter(object):
         is_fs_case_insensitive = (cwd != os.path.sep) and os.path.exists(cwd.upper()) and os.path.exists(cwd.lower())
         flags = re.IGNORECASE if is_fs_case_insensitive else 0
         self.pattern = re.compile(pattern, flags)
+        # bound once, match() is called for every file and filter
+        self._pattern_match = self.pattern.match
 
     def match(self, path):
         os_independent_path = path.replace(os.path.sep, '/')
-        return self.pattern.match(os_independent_path)
+        return self._pattern_match(os_independent_path)
 
     def __str__(self):
         return "{name}({pattern})".format(
@@ -230,9 +230,19 @@ class DirectoryPrefixFilter(Filter):
         pattern = re.escape(os_independent_dir + '/')
         super(DirectoryPrefixFilter, self).__init__(pattern)
 
+        # The pattern is a literal prefix, so str.startswith() is used
+        # for matching. The pattern is only kept for display.
+        self.ignore_case = bool(self.pattern.flags & re.IGNORECASE)
+        self.prefix = os_independent_dir + '/'
+        if self.ignore_case:
+            self.prefix = self.prefix.lower()
+
     def match(self, path):
         normpath = os.path.normpath(path)
-        return super(DirectoryPrefixFilter, self).match(normpath)
+        os_independent_path = normpath.replace(os.path.sep, '/')
+        if self.ignore_case:
+            os_independent_path = os_independent_path.lower()
+        return os_independent_path.startswith(self.prefix)
 
 
 class Logger(object):